@@ -1,28 +1,145 @@
 # main.py - 완전한 통합 백엔드 서버
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, NamedTuple, Set, Tuple
+from contextlib import asynccontextmanager
 import asyncio
+import base64
+import hashlib
+import hmac
+import importlib.util
+import orjson
 import uuid
 from datetime import datetime
 import logging
 import os
 import re
+import time
 import urllib.parse
 import random
 
 # 플레이스 스크래핑 관련 import
+# playwright는 import 비용이 커서 설치 여부만 확인하고, 실제 import는 브라우저를 처음 쓸 때 한다
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec("playwright") is not None
+
+# 작업 저장소(Redis) 관련 import
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# 응답 캐시(fastapi-cache2) 관련 import
+try:
+    from fastapi_cache import FastAPICache
+    from fastapi_cache.backends.inmemory import InMemoryBackend
+    from fastapi_cache.backends.redis import RedisBackend
+    CACHE_AVAILABLE = True
+except ImportError:
+    CACHE_AVAILABLE = False
+
+# 시맨틱 캐시(sentence-transformers) 관련 import - 무거운 의존성이라 활성화한 경우에만 로드
+SEMANTIC_CACHE_ENABLED = os.environ.get("SEMANTIC_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+SEMANTIC_CACHE_AVAILABLE = False
+if SEMANTIC_CACHE_ENABLED:
+    try:
+        import numpy as np
+        from sentence_transformers import SentenceTransformer
+        SEMANTIC_CACHE_AVAILABLE = True
+    except ImportError:
+        pass
+
+# HTTP 검색 결과 수집(httpx, selectolax) 관련 import
+try:
+    import httpx
+    from selectolax.parser import HTMLParser
+    HTTP_SCRAPING_AVAILABLE = True
+except ImportError:
+    HTTP_SCRAPING_AVAILABLE = False
+
 try:
-    from playwright.async_api import async_playwright, TimeoutError
-    PLAYWRIGHT_AVAILABLE = True
+    import h2  # noqa: F401 - httpx HTTP/2 지원
+    HTTP2_AVAILABLE = True
 except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+    HTTP2_AVAILABLE = False
+
+# 다중 패턴 매칭(pyahocorasick) 관련 import
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 작업 큐(Celery) 관련 import
+try:
+    from celery import Celery
+    from celery.result import AsyncResult
+    from celery.signals import worker_process_shutdown
+    CELERY_AVAILABLE = True
+except ImportError:
+    CELERY_AVAILABLE = False
+
+# 데모 설정 (켜면 모의 순위 확인/분석에 실제 스크래핑과 비슷한 지연을 둠)
+SIMULATE_LATENCY = os.environ.get("SIMULATE_LATENCY", "false").lower() in ("1", "true", "yes")
+
+# 작업 저장소 설정
+REDIS_URL = os.environ.get("REDIS_URL")
+REDIS_MAX_CONNECTIONS = int(os.environ.get("REDIS_MAX_CONNECTIONS", 20))
+JOB_TTL_SECONDS = int(os.environ.get("JOB_TTL_SECONDS", 3600))
+JOB_STREAM_KEEPALIVE_SECONDS = float(os.environ.get("JOB_STREAM_KEEPALIVE_SECONDS", 15))
+JOB_PROGRESS_FLUSH_EVERY = int(os.environ.get("JOB_PROGRESS_FLUSH_EVERY", 5))
+JOB_PROGRESS_FLUSH_INTERVAL_SECONDS = float(os.environ.get("JOB_PROGRESS_FLUSH_INTERVAL_SECONDS", 0.5))
+
+# 응답 캐시 설정
+PLACE_CACHE_TTL_SECONDS = int(os.environ.get("PLACE_CACHE_TTL_SECONDS", 3600))
+RANKING_CACHE_TTL_SECONDS = int(os.environ.get("RANKING_CACHE_TTL_SECONDS", 600))
+SEMANTIC_CACHE_MODEL = os.environ.get("SEMANTIC_CACHE_MODEL", "paraphrase-multilingual-MiniLM-L12-v2")
+SEMANTIC_CACHE_THRESHOLD = float(os.environ.get("SEMANTIC_CACHE_THRESHOLD", 0.95))
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.environ.get("SEMANTIC_CACHE_MAX_ENTRIES", 200))
+
+# 공유 브라우저 설정
+BROWSER_POOL_SIZE = int(os.environ.get("BROWSER_POOL_SIZE", 3))
+MAX_USES_PER_BROWSER = int(os.environ.get("BROWSER_MAX_USES", 100))
+BROWSER_CDP_URL = os.environ.get("BROWSER_CDP_URL")
+BROWSER_CDP_PORT = os.environ.get("BROWSER_CDP_PORT")
+BROWSER_PRELAUNCH = os.environ.get("BROWSER_PRELAUNCH", "false").lower() in ("1", "true", "yes")
+
+# HTTP 클라이언트 설정
+HTTP_MAX_CONNECTIONS = int(os.environ.get("HTTP_MAX_CONNECTIONS", 100))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("HTTP_MAX_KEEPALIVE_CONNECTIONS", 50))
+HTTP_TIMEOUT_SECONDS = float(os.environ.get("HTTP_TIMEOUT_SECONDS", 10.0))
+
+# 관리자 API 설정 (설정되지 않으면 관리자 API 비활성화)
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN")
+
+# 작업 큐 설정 (설정되지 않으면 API 프로세스의 BackgroundTasks로 실행)
+CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL")
+CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", CELERY_BROKER_URL)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작/종료 시 공유 리소스 관리"""
+    start_clock()
+    await init_job_store()
+    init_response_cache()
+    get_http_client()
+    await start_browser()
+    try:
+        yield
+    finally:
+        await stop_browser()
+        await close_http_client()
+        await close_job_store()
+        await stop_clock()
 
 app = FastAPI(
     title="네이버 지도 통합 분석 API",
     description="플레이스 정보 분석 + 순위 확인 통합 서비스",
-    version="3.0.0"
+    version="3.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS 설정
@@ -44,12 +161,453 @@ if PLAYWRIGHT_AVAILABLE:
 else:
     logger.warning("Playwright 라이브러리를 찾을 수 없습니다. 스크래핑 기능이 제한됩니다.")
 
-# 진행 중인 작업 저장소
-active_jobs: Dict[str, Dict[str, Any]] = {}
+# ============ Clock ============
+# 응답·작업 상태에 넣는 타임스탬프 문자열을 매번 만들지 않고 백그라운드 작업이
+# CLOCK_TICK_SECONDS마다 갱신해 둔다. 틱이 돌지 않는 프로세스(Celery 워커 등)이거나
+# 갱신이 밀렸으면 그 자리에서 다시 계산한다.
+CLOCK_TICK_SECONDS = 0.1
+
+_now_cache = {"iso": "", "ts": 0.0}
+_clock_task: Optional[asyncio.Task] = None
+
+def _refresh_now() -> str:
+    now = time.time()
+    _now_cache["iso"] = datetime.fromtimestamp(now).isoformat()
+    _now_cache["ts"] = now
+    return _now_cache["iso"]
+
+def now_iso() -> str:
+    """현재 시각 ISO 문자열 (최대 CLOCK_TICK_SECONDS 정도 늦을 수 있음)"""
+    if time.time() - _now_cache["ts"] > CLOCK_TICK_SECONDS * 2:
+        return _refresh_now()
+    return _now_cache["iso"]
+
+async def _tick_clock():
+    while True:
+        _refresh_now()
+        await asyncio.sleep(CLOCK_TICK_SECONDS)
+
+def start_clock():
+    """타임스탬프 갱신 작업 시작"""
+    global _clock_task
+    
+    if _clock_task is None:
+        _clock_task = asyncio.create_task(_tick_clock())
+
+async def stop_clock():
+    """타임스탬프 갱신 작업 종료"""
+    global _clock_task
+    
+    if _clock_task is not None:
+        _clock_task.cancel()
+        try:
+            await _clock_task
+        except asyncio.CancelledError:
+            pass
+        _clock_task = None
+
+# ============ Job Store ============
+# REDIS_URL이 설정되면 작업 상태를 Redis 해시(job:{job_id})에 저장해 워커 간에 공유하고,
+# 설정되지 않으면 같은 형식으로 프로세스 메모리에 보관한다. 모든 작업은 마지막 갱신 후
+# JOB_TTL_SECONDS가 지나면 자동으로 만료된다. 저장할 때마다 갱신된 필드를
+# job:{job_id}:updates 채널로 발행해 SSE 스트림이 폴링 없이 변경 사항을 받는다.
+# 작업 레코드는 create_job으로만 만들고, save_job은 레코드가 남아 있을 때만 갱신하므로
+# 삭제(또는 만료)된 작업을 백그라운드 작업이 다시 만들지 않는다.
+# 작업 ID는 만료 시각을 점수로 하는 정렬 집합(jobs:index)에도 기록해, 작업 수 집계와
+# 목록 조회가 키 공간 전체를 SCAN하지 않고 인덱스만 읽도록 한다.
+redis_pool = None
+redis_client = None
+_update_job_script = None
+_memory_jobs: Dict[str, Dict[str, bytes]] = {}
+_memory_job_expiry: Dict[str, float] = {}
+_memory_job_subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+JOB_FINISHED_STATUSES = ("completed", "failed", "cancelled")
+JOB_INDEX_KEY = "jobs:index"
+
+# KEYS[1]: 작업 해시, KEYS[2]: 작업 인덱스
+# ARGV[1]: TTL, ARGV[2]: 만료 시각, ARGV[3]: 작업 ID, ARGV[4]: 갱신 채널, ARGV[5]: 갱신 내용,
+# ARGV[6..]: 필드/값 쌍
+UPDATE_JOB_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return 0
+end
+redis.call("HSET", KEYS[1], unpack(ARGV, 6))
+redis.call("EXPIRE", KEYS[1], ARGV[1])
+redis.call("ZADD", KEYS[2], ARGV[2], ARGV[3])
+redis.call("PUBLISH", ARGV[4], ARGV[5])
+return 1
+"""
+
+async def init_job_store():
+    """작업 저장소 연결 초기화"""
+    global redis_pool, redis_client, _update_job_script
+    
+    if not REDIS_URL:
+        logger.info("REDIS_URL이 설정되지 않아 작업 상태를 메모리에 저장합니다")
+        return
+    if not REDIS_AVAILABLE:
+        logger.warning("redis 라이브러리를 찾을 수 없습니다. 작업 상태를 메모리에 저장합니다.")
+        return
+    
+    redis_pool = aioredis.ConnectionPool.from_url(REDIS_URL, max_connections=REDIS_MAX_CONNECTIONS)
+    redis_client = aioredis.Redis(connection_pool=redis_pool)
+    _update_job_script = redis_client.register_script(UPDATE_JOB_SCRIPT)
+    await redis_client.ping()
+    logger.info("Redis 작업 저장소 연결 성공")
+
+async def close_job_store():
+    """작업 저장소 연결 종료"""
+    global redis_pool, redis_client
+    
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
+    if redis_pool is not None:
+        await redis_pool.disconnect()
+        redis_pool = None
+
+def _job_key(job_id: str) -> str:
+    return f"job:{job_id}"
+
+def _job_channel(job_id: str) -> str:
+    return f"job:{job_id}:updates"
+
+def _encode_job_fields(fields: Dict[str, Any]) -> Dict[str, bytes]:
+    """작업 필드를 해시 값(JSON)으로 인코딩 (datetime은 ISO 8601 문자열)"""
+    return {name: orjson.dumps(value, default=str) for name, value in fields.items()}
+
+def _decode_job_fields(fields: Dict[Any, Any]) -> Dict[str, Any]:
+    """해시 값(JSON)을 작업 필드로 디코딩"""
+    return {
+        (name.decode() if isinstance(name, bytes) else name): orjson.loads(value)
+        for name, value in fields.items()
+    }
+
+def _join_encoded_fields(encoded: Dict[str, bytes]) -> bytes:
+    """인코딩된 필드들을 하나의 JSON 객체로 결합 (값을 다시 직렬화하지 않음)"""
+    return b"{" + b",".join(orjson.dumps(name) + b":" + value for name, value in encoded.items()) + b"}"
+
+def _purge_expired_memory_jobs():
+    """메모리 저장소의 만료된 작업 정리"""
+    now = time.monotonic()
+    expired = [job_id for job_id, expires_at in _memory_job_expiry.items() if expires_at <= now]
+    for job_id in expired:
+        _memory_jobs.pop(job_id, None)
+        _memory_job_expiry.pop(job_id, None)
+
+async def create_job(job_id: str, fields: Dict[str, Any]):
+    """작업 레코드 생성 (초기 필드 저장 및 TTL 설정)"""
+    encoded = _encode_job_fields(fields)
+    
+    if redis_client is None:
+        _purge_expired_memory_jobs()
+        _memory_jobs[job_id] = encoded
+        _memory_job_expiry[job_id] = time.monotonic() + JOB_TTL_SECONDS
+        return
+    
+    key = _job_key(job_id)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(key, mapping=encoded)
+        pipe.expire(key, JOB_TTL_SECONDS)
+        pipe.zadd(JOB_INDEX_KEY, {job_id: time.time() + JOB_TTL_SECONDS})
+        await pipe.execute()
+
+async def save_job(job_id: str, fields: Dict[str, Any]) -> bool:
+    """
+    작업 필드 저장 (지정한 필드만 갱신하고 TTL 연장, 갱신 내용 발행)
+    작업이 삭제되었거나 만료되었으면 저장하지 않고 False 반환
+    """
+    encoded = _encode_job_fields(fields)
+    update = _join_encoded_fields(encoded)
+    
+    if redis_client is None:
+        _purge_expired_memory_jobs()
+        stored = _memory_jobs.get(job_id)
+        if stored is None:
+            return False
+        stored.update(encoded)
+        _memory_job_expiry[job_id] = time.monotonic() + JOB_TTL_SECONDS
+        for queue in _memory_job_subscribers.get(job_id, ()):
+            queue.put_nowait(update)
+        return True
+    
+    args = [JOB_TTL_SECONDS, time.time() + JOB_TTL_SECONDS, job_id, _job_channel(job_id), update]
+    for name, value in encoded.items():
+        args += (name, value)
+    return bool(await _update_job_script(keys=[_job_key(job_id), JOB_INDEX_KEY], args=args))
+
+@asynccontextmanager
+async def subscribe_job_updates(job_id: str):
+    """
+    작업 갱신 구독
+    timeout초 동안 갱신을 기다려 JSON(갱신된 필드) 또는 None을 반환하는 함수를 제공
+    """
+    if redis_client is None:
+        queue: asyncio.Queue = asyncio.Queue()
+        _memory_job_subscribers.setdefault(job_id, set()).add(queue)
+        
+        async def next_update(timeout: float) -> Optional[bytes]:
+            try:
+                return await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        
+        try:
+            yield next_update
+        finally:
+            subscribers = _memory_job_subscribers.get(job_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del _memory_job_subscribers[job_id]
+        return
+    
+    pubsub = redis_client.pubsub()
+    await pubsub.subscribe(_job_channel(job_id))
+    
+    async def next_update(timeout: float) -> Optional[bytes]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while (remaining := deadline - loop.time()) > 0:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+            if message is not None:
+                return message["data"]
+        return None
+    
+    try:
+        yield next_update
+    finally:
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
+
+async def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """작업 상태 조회 (없거나 만료되면 None)"""
+    if redis_client is None:
+        _purge_expired_memory_jobs()
+        fields = _memory_jobs.get(job_id)
+    else:
+        fields = await redis_client.hgetall(_job_key(job_id))
+    
+    return _decode_job_fields(fields) if fields else None
+
+async def delete_job(job_id: str):
+    """작업 삭제"""
+    if redis_client is None:
+        _memory_jobs.pop(job_id, None)
+        _memory_job_expiry.pop(job_id, None)
+        return
+    
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.delete(_job_key(job_id))
+        pipe.zrem(JOB_INDEX_KEY, job_id)
+        await pipe.execute()
+
+async def _live_job_ids() -> List[bytes]:
+    """인덱스에서 만료된 작업을 정리하고 남은 작업 ID 조회"""
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.zremrangebyscore(JOB_INDEX_KEY, "-inf", time.time())
+        pipe.zrange(JOB_INDEX_KEY, 0, -1)
+        _, job_ids = await pipe.execute()
+    return job_ids
+
+async def list_jobs(*field_names: str) -> List[Dict[str, Any]]:
+    """저장된 작업 목록 조회 (field_names를 지정하면 해당 필드만, 없는 필드는 None)"""
+    if redis_client is None:
+        _purge_expired_memory_jobs()
+        stored = list(_memory_jobs.values())
+        if field_names:
+            stored = [{name: fields.get(name) for name in field_names} for fields in stored]
+    else:
+        job_ids = await _live_job_ids()
+        if not job_ids:
+            return []
+        
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                key = _job_key(job_id.decode())
+                if field_names:
+                    pipe.hmget(key, field_names)
+                else:
+                    pipe.hgetall(key)
+            replies = await pipe.execute()
+        
+        if field_names:
+            stored = [dict(zip(field_names, values)) for values in replies if any(values)]
+        else:
+            stored = [fields for fields in replies if fields]
+    
+    if field_names:
+        return [
+            {name: (orjson.loads(value) if value is not None else None) for name, value in fields.items()}
+            for fields in stored
+        ]
+    return [_decode_job_fields(fields) for fields in stored]
+
+async def count_jobs() -> int:
+    """저장된 작업 수"""
+    if redis_client is None:
+        _purge_expired_memory_jobs()
+        return len(_memory_jobs)
+    
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.zremrangebyscore(JOB_INDEX_KEY, "-inf", time.time())
+        pipe.zcard(JOB_INDEX_KEY)
+        _, count = await pipe.execute()
+    return count
+
+# ============ Response Cache ============
+# 플레이스 분석 결과(URL 기준)와 키워드별 순위 결과(업체·키워드·위치 기준)를 캐시한다.
+# 작업 저장소와 같은 Redis를 사용하고, Redis가 없으면 프로세스 메모리에 보관한다.
+# 캐시 장애는 요청 실패로 이어지지 않도록 경고만 남기고 캐시 미스로 처리한다.
+RESPONSE_CACHE_PREFIX = "cache"
+response_cache_ready = False
+
+def init_response_cache():
+    """응답 캐시 백엔드 초기화 (작업 저장소 초기화 이후 호출)"""
+    global response_cache_ready
+    
+    if not CACHE_AVAILABLE:
+        logger.warning("fastapi-cache2 라이브러리를 찾을 수 없습니다. 응답 캐시를 사용하지 않습니다.")
+        return
+    
+    FastAPICache.reset()
+    backend = RedisBackend(redis_client) if redis_client is not None else InMemoryBackend()
+    FastAPICache.init(backend, prefix=RESPONSE_CACHE_PREFIX)
+    response_cache_ready = True
+
+def response_cache_key(namespace: str, *parts: Any) -> str:
+    """캐시 키 생성 ({prefix}:{namespace}:{sha256})"""
+    digest = hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()
+    return f"{RESPONSE_CACHE_PREFIX}:{namespace}:{digest}"
+
+async def cache_get(key: str) -> Optional[Any]:
+    """캐시 조회 (없으면 None)"""
+    if not response_cache_ready:
+        return None
+    
+    try:
+        value = await FastAPICache.get_backend().get(key)
+    except Exception as e:
+        logger.warning(f"캐시 조회 오류: {e}")
+        return None
+    
+    return orjson.loads(value) if value is not None else None
+
+async def cache_set(key: str, value: Any, expire: int):
+    """캐시 저장"""
+    if not response_cache_ready:
+        return
+    
+    try:
+        await FastAPICache.get_backend().set(key, orjson.dumps(value, default=str), expire=expire)
+    except Exception as e:
+        logger.warning(f"캐시 저장 오류: {e}")
+
+async def clear_response_cache(namespace: str) -> int:
+    """네임스페이스의 캐시 전체 삭제 (삭제된 키 수 반환)"""
+    if not response_cache_ready:
+        return 0
+    
+    if redis_client is None:
+        return await FastAPICache.clear(namespace=namespace)
+    
+    keys = [key async for key in redis_client.scan_iter(match=f"{RESPONSE_CACHE_PREFIX}:{namespace}:*", count=500)]
+    if keys:
+        await redis_client.unlink(*keys)
+    return len(keys)
+
+# ============ Semantic Cache ============
+# "영어학원", "영어 학원"처럼 표현만 다른 키워드는 같은 순위 결과를 내므로, 같은 업체·위치
+# 범위(scope) 안에서 키워드 임베딩의 코사인 유사도가 SEMANTIC_CACHE_THRESHOLD 이상이면
+# 이전 결과를 재사용한다. 범위별 항목은 응답 캐시에 하나의 목록으로 저장하고,
+# 항목마다 RANKING_CACHE_TTL_SECONDS가 지나면 무시한다.
+_embedding_model = None
+_embedding_model_lock = asyncio.Lock()
+semantic_cache_disabled = False
+
+async def _get_embedding_model():
+    """임베딩 모델 로드 (최초 1회, 실패 시 시맨틱 캐시 비활성화)"""
+    global _embedding_model, semantic_cache_disabled
+    
+    async with _embedding_model_lock:
+        if _embedding_model is None and not semantic_cache_disabled:
+            try:
+                _embedding_model = await asyncio.to_thread(SentenceTransformer, SEMANTIC_CACHE_MODEL)
+                logger.info(f"시맨틱 캐시 임베딩 모델 로드: {SEMANTIC_CACHE_MODEL}")
+            except Exception as e:
+                semantic_cache_disabled = True
+                logger.error(f"임베딩 모델 로드 실패, 시맨틱 캐시를 사용하지 않습니다: {e}")
+    
+    return _embedding_model
+
+def _semantic_cache_active() -> bool:
+    return SEMANTIC_CACHE_AVAILABLE and response_cache_ready and not semantic_cache_disabled
+
+async def semantic_cache_lookup(scope: str, keywords: List[str]):
+    """
+    유사 키워드의 캐시된 결과 조회
+    (키워드별 결과 또는 None, 키워드별 임베딩 또는 None) 튜플 반환
+    """
+    misses = [None] * len(keywords)
+    if not keywords or not _semantic_cache_active():
+        return misses, misses
+    
+    model = await _get_embedding_model()
+    if model is None:
+        return misses, misses
+    
+    vectors = await asyncio.to_thread(model.encode, keywords, normalize_embeddings=True)
+    
+    now = time.time()
+    entries = [
+        entry for entry in (await cache_get(scope) or [])
+        if now - entry["cached_at"] < RANKING_CACHE_TTL_SECONDS
+    ]
+    if not entries:
+        return misses, list(vectors)
+    
+    # 정규화된 임베딩이므로 내적이 곧 코사인 유사도
+    matrix = np.stack([np.frombuffer(base64.b64decode(entry["embedding"]), dtype=np.float32) for entry in entries])
+    similarities = vectors @ matrix.T
+    
+    hits = []
+    for keyword, row in zip(keywords, similarities):
+        best = int(row.argmax())
+        if row[best] >= SEMANTIC_CACHE_THRESHOLD:
+            hits.append({**entries[best]["result"], "keyword": keyword})
+        else:
+            hits.append(None)
+    
+    return hits, list(vectors)
+
+async def semantic_cache_store(scope: str, vectors: List[Any], results: List[Dict[str, Any]]):
+    """새로 확인한 결과를 임베딩과 함께 범위 목록에 추가"""
+    new_entries = [
+        {
+            "embedding": base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode(),
+            "result": result,
+            "cached_at": time.time()
+        }
+        for vector, result in zip(vectors, results)
+        if vector is not None
+    ]
+    if not new_entries or not _semantic_cache_active():
+        return
+    
+    now = time.time()
+    entries = [
+        entry for entry in (await cache_get(scope) or [])
+        if now - entry["cached_at"] < RANKING_CACHE_TTL_SECONDS
+    ]
+    entries = (entries + new_entries)[-SEMANTIC_CACHE_MAX_ENTRIES:]
+    await cache_set(scope, entries, RANKING_CACHE_TTL_SECONDS)
 
 # ============ Request Models ============
+DEFAULT_MAX_CONCURRENT = 3
+
 class LocationSettings(BaseModel):
-    type: str = Field(..., regex="^(coords|address|url)$")
+    type: str = Field(..., pattern="^(coords|address|url)$")
     lat: Optional[float] = Field(None, ge=-90, le=90)
     lng: Optional[float] = Field(None, ge=-180, le=180)
     name: Optional[str] = None
@@ -61,15 +619,15 @@ class PlaceAnalysisRequest(BaseModel):
 
 class RankingRequest(BaseModel):
     target_business: str = Field(..., min_length=1, max_length=100)
-    keywords: List[str] = Field(..., min_items=1, max_items=20)
+    keywords: List[str] = Field(..., min_length=1, max_length=20)
     location: LocationSettings
     max_pages: int = Field(3, ge=1, le=5)
-    max_concurrent: Optional[int] = Field(3, ge=1, le=5)
+    max_concurrent: Optional[int] = Field(DEFAULT_MAX_CONCURRENT, ge=1, le=5)
 
 class IntegratedAnalysisRequest(BaseModel):
     place_url: str = Field(..., description="네이버 플레이스 URL")
     target_business: str = Field(..., min_length=1, max_length=100)
-    keywords: List[str] = Field(..., min_items=1, max_items=20)
+    keywords: List[str] = Field(..., min_length=1, max_length=20)
     location: LocationSettings
     max_pages: int = Field(3, ge=1, le=5)
 
@@ -114,31 +672,42 @@ class RankingResult(BaseModel):
     error: Optional[str] = None
 
 # ============ API Endpoints ============
+# 내용이 바뀌지 않는 응답은 미리 직렬화해 두고 그대로 반환
+_ROOT_BYTES = orjson.dumps({
+    "message": "네이버 지도 통합 분석 API v3.0",
+    "status": "running",
+    "features": ["플레이스 분석", "순위 확인", "통합 리포트", "병렬 처리"],
+    "endpoints": {
+        "place_analysis": "/api/analyze-place",
+        "ranking_check": "/api/check-ranking", 
+        "integrated_analysis": "/api/integrated-analysis",
+        "health_check": "/health"
+    }
+})
+
+_BASE_HEALTH = {
+    "status": "healthy",
+    "message": "통합 API 서버가 정상적으로 실행 중입니다",
+    "version": "3.0.0",
+    "playwright_available": PLAYWRIGHT_AVAILABLE,
+    "scraping_mode": "실제 스크래핑" if PLAYWRIGHT_AVAILABLE else "샘플 데이터"
+}
+
 @app.get("/")
 async def root():
-    return {
-        "message": "네이버 지도 통합 분석 API v3.0",
-        "status": "running",
-        "features": ["플레이스 분석", "순위 확인", "통합 리포트", "병렬 처리"],
-        "endpoints": {
-            "place_analysis": "/api/analyze-place",
-            "ranking_check": "/api/check-ranking", 
-            "integrated_analysis": "/api/integrated-analysis",
-            "health_check": "/health"
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "active_jobs": len(active_jobs),
-        "message": "통합 API 서버가 정상적으로 실행 중입니다",
-        "timestamp": datetime.now().isoformat(),
-        "version": "3.0.0",
-        "playwright_available": PLAYWRIGHT_AVAILABLE,
-        "scraping_mode": "실제 스크래핑" if PLAYWRIGHT_AVAILABLE else "샘플 데이터"
-    }
+    return Response(
+        content=orjson.dumps({
+            **_BASE_HEALTH,
+            "active_jobs": await count_jobs(),
+            "timestamp": now_iso(),
+            "job_store": "redis" if redis_client is not None else "memory"
+        }),
+        media_type="application/json"
+    )
 
 @app.post("/api/analyze-place", response_model=PlaceAnalysisResult)
 async def analyze_place(request: PlaceAnalysisRequest):
@@ -149,6 +718,12 @@ async def analyze_place(request: PlaceAnalysisRequest):
     try:
         logger.info(f"플레이스 분석 요청: {request.url}")
         
+        cache_key = response_cache_key("place", request.url)
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"플레이스 분석 캐시 적중: {request.url}")
+            return cached
+        
         # URL에서 업체명 추출 시도
         business_name = extract_business_name_from_url(request.url)
         if not business_name:
@@ -159,6 +734,7 @@ async def analyze_place(request: PlaceAnalysisRequest):
         
         # 데모용 샘플 데이터 생성
         place_data = generate_sample_place_analysis(business_name)
+        await cache_set(cache_key, place_data.model_dump(mode="json"), PLACE_CACHE_TTL_SECONDS)
         
         logger.info(f"플레이스 분석 완료: {business_name}")
         return place_data
@@ -174,28 +750,40 @@ async def check_ranking(request: RankingRequest):
         logger.info(f"순위 확인 요청: {len(request.keywords)}개 키워드")
         
         # 실제로는 병렬 스크래핑 수행
-        # results = await search_multiple_keywords_parallel(...)
+        # results = await search_multiple_keywords_parallel(
+        #     request.keywords, request.target_business, request.location,
+        #     request.max_pages, request.max_concurrent or DEFAULT_MAX_CONCURRENT
+        # )
         
-        # 데모용 결과 생성
-        results = []
-        for keyword in request.keywords:
-            await asyncio.sleep(0.5)  # 시뮬레이션 지연
-            
-            # 모의 순위 생성
-            rank = generate_mock_rank(keyword, request.target_business)
-            
-            result = RankingResult(
-                keyword=keyword,
-                target_business=request.target_business,
-                found=rank is not None,
-                rank=rank,
-                total_results=rank * 10 if rank else 0,
-                pages_checked=min(3, (rank // 10) + 1) if rank else 3,
-                processing_time=0.5
+        # 동일 키워드 캐시 → 유사 키워드(시맨틱) 캐시 순으로 조회하고 남은 키워드만 확인
+        location = request.location
+        scope = (request.target_business, request.max_pages, location.lat, location.lng, location.address, location.url)
+        cache_keys = [response_cache_key("ranking", keyword, *scope) for keyword in request.keywords]
+        results = list(await asyncio.gather(*(cache_get(key) for key in cache_keys)))
+        pending = [i for i, hit in enumerate(results) if hit is None]
+        
+        semantic_scope = response_cache_key("semantic", *scope)
+        similar, vectors = await semantic_cache_lookup(semantic_scope, [request.keywords[i] for i in pending])
+        for i, hit in zip(pending, similar):
+            results[i] = hit
+        missing = [(i, vector) for i, vector in zip(pending, vectors) if results[i] is None]
+        
+        # 데모용 결과 생성 (키워드별 동시 실행)
+        fresh = []
+        if missing:
+            fresh = await run_ranking_checks(
+                [request.keywords[i] for i, _ in missing],
+                request.target_business,
+                max_concurrent=request.max_concurrent or DEFAULT_MAX_CONCURRENT,
+                delay=0.5
             )
-            results.append(result)
+            for (i, _), result in zip(missing, fresh):
+                results[i] = result
         
-        logger.info(f"순위 확인 완료: {len(results)}개 결과")
+        await asyncio.gather(*(cache_set(cache_keys[i], results[i], RANKING_CACHE_TTL_SECONDS) for i in pending))
+        await semantic_cache_store(semantic_scope, [vector for _, vector in missing], fresh)
+        
+        logger.info(f"순위 확인 완료: {len(results)}개 결과 (캐시 {len(results) - len(fresh)}개)")
         return results
         
     except Exception as e:
@@ -214,18 +802,18 @@ async def start_parallel_ranking_check(
         job_id = str(uuid.uuid4())
         
         # 작업 상태 초기화
-        active_jobs[job_id] = {
+        await create_job(job_id, {
             "job_id": job_id,
             "status": "pending",
             "progress": 0.0,
             "total_keywords": len(request.keywords),
             "completed_keywords": 0,
-            "started_at": datetime.now(),
+            "started_at": now_iso(),
             "results": []
-        }
+        })
         
         # 백그라운드 실행
-        background_tasks.add_task(execute_parallel_ranking, job_id, request)
+        await enqueue_job(background_tasks, job_id, request, execute_parallel_ranking, "rank.parallel_ranking")
         
         return {
             "job_id": job_id,
@@ -244,59 +832,105 @@ async def start_integrated_analysis(
 ):
     """통합 분석 시작 (플레이스 분석 + 순위 확인)"""
     
-    # 작업 ID 생성
-    job_id = str(uuid.uuid4())
-    
-    # 작업 상태 초기화
-    active_jobs[job_id] = {
-        "job_id": job_id,
-        "status": "pending",
-        "progress": 0.0,
-        "steps": {
-            "place_analysis": "pending",
-            "ranking_check": "pending"
-        },
-        "started_at": datetime.now(),
-        "results": {
-            "place_analysis": None,
-            "ranking_results": None
+    try:
+        # 작업 ID 생성
+        job_id = str(uuid.uuid4())
+        
+        # 작업 상태 초기화
+        await create_job(job_id, {
+            "job_id": job_id,
+            "status": "pending",
+            "progress": 0.0,
+            "steps": {
+                "place_analysis": "pending",
+                "ranking_check": "pending"
+            },
+            "started_at": now_iso(),
+            "results": {
+                "place_analysis": None,
+                "ranking_results": None
+            }
+        })
+        
+        # 백그라운드 실행
+        await enqueue_job(background_tasks, job_id, request, execute_integrated_analysis, "rank.integrated_analysis")
+        
+        return {
+            "job_id": job_id,
+            "status": "started",
+            "message": "통합 분석이 시작되었습니다",
+            "estimated_time": "2-3분"
         }
-    }
-    
-    # 백그라운드 실행
-    background_tasks.add_task(execute_integrated_analysis, job_id, request)
-    
-    return {
-        "job_id": job_id,
-        "status": "started",
-        "message": "통합 분석이 시작되었습니다",
-        "estimated_time": "2-3분"
-    }
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"작업 시작 실패: {str(e)}")
 
 @app.get("/api/job-status/{job_id}")
 async def get_job_status(job_id: str):
     """작업 진행 상황 확인"""
-    if job_id not in active_jobs:
+    job_data = await get_job(job_id)
+    if job_data is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    
+    if celery_app is not None:
+        job_data["task_state"] = await get_task_state(job_id)
+    
+    return job_data
+
+@app.get("/api/job-status/{job_id}/stream")
+async def stream_job_status(job_id: str):
+    """
+    작업 진행 상황 실시간 스트리밍 (Server-Sent Events)
+    처음에 전체 상태(snapshot)를 보내고, 이후 갱신된 필드만(update) 보내며 작업이 끝나면 종료
+    """
+    async def events():
+        # 스냅샷 조회 전에 구독해야 그 사이의 갱신을 놓치지 않음
+        async with subscribe_job_updates(job_id) as next_update:
+            job_data = await get_job(job_id)
+            if job_data is None:
+                yield b"event: error\ndata: " + orjson.dumps({"detail": "작업을 찾을 수 없습니다"}) + b"\n\n"
+                return
+            
+            yield b"event: snapshot\ndata: " + orjson.dumps(job_data) + b"\n\n"
+            status = job_data["status"]
+            
+            while status not in JOB_FINISHED_STATUSES:
+                update = await next_update(JOB_STREAM_KEEPALIVE_SECONDS)
+                if update is None:
+                    yield b": keepalive\n\n"
+                    continue
+                
+                yield b"event: update\ndata: " + update + b"\n\n"
+                status = orjson.loads(update).get("status", status)
+    
+    if await get_job(job_id) is None:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
     
-    return active_jobs[job_id]
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.get("/api/integrated-status/{job_id}")
 async def get_integrated_status(job_id: str):
     """통합 분석 진행 상황 확인"""
-    if job_id not in active_jobs:
+    job_data = await get_job(job_id)
+    if job_data is None:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
     
-    return active_jobs[job_id]
+    if celery_app is not None:
+        job_data["task_state"] = await get_task_state(job_id)
+    
+    return job_data
 
 @app.get("/api/integrated-results/{job_id}")
 async def get_integrated_results(job_id: str):
     """통합 분석 결과 가져오기"""
-    if job_id not in active_jobs:
+    job_data = await get_job(job_id)
+    if job_data is None:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
     
-    job_data = active_jobs[job_id]
-    
     if job_data["status"] != "completed":
         raise HTTPException(
             status_code=400, 
@@ -314,78 +948,142 @@ async def get_integrated_results(job_id: str):
 @app.delete("/api/job/{job_id}")
 async def cancel_or_delete_job(job_id: str):
     """작업 취소 또는 삭제"""
-    if job_id not in active_jobs:
+    job_data = await get_job(job_id)
+    if job_data is None:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
     
-    job_status = active_jobs[job_id]["status"]
+    job_status = job_data["status"]
     
     if job_status in ["pending", "running"]:
-        active_jobs[job_id]["status"] = "cancelled"
+        await save_job(job_id, {"status": "cancelled"})
+        if celery_app is not None:
+            # 아직 워커가 가져가지 않은 작업은 큐에서 제거
+            await asyncio.to_thread(celery_app.control.revoke, job_id)
         return {"message": "작업이 취소되었습니다"}
     else:
-        del active_jobs[job_id]
+        await delete_job(job_id)
         return {"message": "작업이 삭제되었습니다"}
 
 @app.get("/api/active-jobs")
 async def get_active_jobs():
     """현재 활성 작업 목록"""
+    # 결과 본문은 제외하고 요약에 필요한 필드만 조회
+    jobs = await list_jobs("job_id", "status", "progress", "started_at", "steps")
+    
     jobs_summary = []
-    for job_id, job_data in active_jobs.items():
+    for job_data in jobs:
         jobs_summary.append({
-            "job_id": job_id,
+            "job_id": job_data["job_id"],
             "status": job_data["status"],
-            "progress": job_data.get("progress", 0),
+            "progress": job_data["progress"] or 0,
             "started_at": job_data["started_at"],
-            "type": "integrated" if "steps" in job_data else "ranking"
+            "type": "integrated" if job_data["steps"] is not None else "ranking"
         })
     
     return {
-        "active_jobs_count": len(active_jobs),
+        "active_jobs_count": len(jobs),
         "jobs": jobs_summary
     }
 
+async def verify_admin_token(x_admin_token: Optional[str] = Header(None)):
+    """관리자 API 인증 (X-Admin-Token 헤더가 ADMIN_TOKEN과 일치해야 함)"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="관리자 API가 비활성화되어 있습니다")
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="관리자 토큰이 올바르지 않습니다")
+
+@app.post("/api/admin/cache/clear", dependencies=[Depends(verify_admin_token)])
+async def clear_cache():
+    """플레이스 분석/순위 확인/유사 키워드 캐시 초기화"""
+    cleared = {
+        "place": await clear_response_cache("place"),
+        "ranking": await clear_response_cache("ranking"),
+        "semantic": await clear_response_cache("semantic")
+    }
+    logger.info(f"응답 캐시 초기화: {cleared}")
+    
+    return {
+        "message": "캐시가 초기화되었습니다",
+        "cleared": cleared
+    }
+
 # ============ Background Tasks ============
+@asynccontextmanager
+async def batched_job_progress(job_id: str, total: int):
+    """
+    키워드 완료 알림을 모아 진행률을 한 번에 저장하는 콜백 제공
+    JOB_PROGRESS_FLUSH_EVERY개가 모이거나 첫 알림 후 JOB_PROGRESS_FLUSH_INTERVAL_SECONDS가
+    지나면 저장하며, 콜백 자체는 큐에 넣기만 하므로 검색 작업을 막지 않음
+    """
+    pending: asyncio.Queue = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+    
+    async def flusher():
+        completed = 0
+        finished = False
+        while not finished:
+            item = await pending.get()
+            if item is None:
+                break
+            
+            batch = 1
+            deadline = loop.time() + JOB_PROGRESS_FLUSH_INTERVAL_SECONDS
+            while batch < JOB_PROGRESS_FLUSH_EVERY:
+                try:
+                    item = await asyncio.wait_for(pending.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    finished = True
+                    break
+                batch += 1
+            
+            completed += batch
+            await save_job(job_id, {
+                "progress": (completed / total) * 100,
+                "completed_keywords": completed
+            })
+    
+    async def report_progress(result: Dict[str, Any]):
+        pending.put_nowait(result)
+    
+    task = asyncio.create_task(flusher())
+    try:
+        yield report_progress
+    finally:
+        # 남은 알림을 저장한 뒤 종료 (저장 중 취소하지 않음)
+        pending.put_nowait(None)
+        await task
+
 async def execute_parallel_ranking(job_id: str, request: RankingRequest):
     """병렬 순위 확인 실행"""
     try:
-        active_jobs[job_id]["status"] = "running"
+        if not await save_job(job_id, {"status": "running"}):
+            logger.info(f"삭제된 작업이라 실행하지 않음: {job_id}")
+            return
         
-        results = []
-        for i, keyword in enumerate(request.keywords):
-            # 진행률 업데이트
-            progress = (i / len(request.keywords)) * 100
-            active_jobs[job_id]["progress"] = progress
-            active_jobs[job_id]["completed_keywords"] = i
-            
-            # 시뮬레이션 지연
-            await asyncio.sleep(2)
-            
-            # 모의 결과 생성
-            rank = generate_mock_rank(keyword, request.target_business)
-            result = {
-                "keyword": keyword,
-                "target_business": request.target_business,
-                "found": rank is not None,
-                "rank": rank,
-                "total_results": rank * 10 if rank else 0,
-                "pages_checked": min(3, (rank // 10) + 1) if rank else 3,
-                "processing_time": 2.0
-            }
-            results.append(result)
+        async with batched_job_progress(job_id, len(request.keywords)) as report_progress:
+            results = await run_ranking_checks(
+                request.keywords,
+                request.target_business,
+                max_concurrent=request.max_concurrent or DEFAULT_MAX_CONCURRENT,
+                delay=2,
+                on_result=report_progress
+            )
         
         # 완료 처리
-        active_jobs[job_id].update({
+        await save_job(job_id, {
             "status": "completed",
             "progress": 100.0,
             "completed_keywords": len(request.keywords),
             "results": results,
-            "completed_at": datetime.now()
+            "completed_at": now_iso()
         })
         
         logger.info(f"병렬 순위 확인 완료: {job_id}")
         
     except Exception as e:
-        active_jobs[job_id].update({
+        await save_job(job_id, {
             "status": "failed",
             "error": str(e)
         })
@@ -393,64 +1091,150 @@ async def execute_parallel_ranking(job_id: str, request: RankingRequest):
 
 async def execute_integrated_analysis(job_id: str, request: IntegratedAnalysisRequest):
     """통합 분석 실행"""
+    # 중첩 필드(steps, results)는 로컬에서 갱신한 뒤 필드 단위로 저장
+    steps = {"place_analysis": "pending", "ranking_check": "pending"}
+    results = {"place_analysis": None, "ranking_results": None}
+    
     try:
         # 1단계: 플레이스 분석
-        active_jobs[job_id]["status"] = "running"
-        active_jobs[job_id]["steps"]["place_analysis"] = "running"
-        active_jobs[job_id]["progress"] = 25.0
+        steps["place_analysis"] = "running"
+        if not await save_job(job_id, {"status": "running", "steps": steps, "progress": 25.0}):
+            logger.info(f"삭제된 작업이라 실행하지 않음: {job_id}")
+            return
         
         business_name = extract_business_name_from_url(request.place_url)
         place_analysis = generate_sample_place_analysis(business_name or request.target_business)
         
-        active_jobs[job_id]["steps"]["place_analysis"] = "completed"
-        active_jobs[job_id]["results"]["place_analysis"] = place_analysis.dict()
-        active_jobs[job_id]["progress"] = 50.0
+        steps["place_analysis"] = "completed"
+        results["place_analysis"] = place_analysis.model_dump(mode="json")
+        await save_job(job_id, {"steps": steps, "results": results, "progress": 50.0})
         
-        await asyncio.sleep(2)  # 시뮬레이션 지연
+        await simulate_latency(2)
         
         # 2단계: 순위 확인
-        active_jobs[job_id]["steps"]["ranking_check"] = "running"
-        active_jobs[job_id]["progress"] = 75.0
-        
-        ranking_results = []
-        for keyword in request.keywords:
-            rank = generate_mock_rank(keyword, request.target_business)
-            result = {
-                "keyword": keyword,
-                "target_business": request.target_business,
-                "found": rank is not None,
-                "rank": rank,
-                "total_results": rank * 10 if rank else 0,
-                "pages_checked": min(3, (rank // 10) + 1) if rank else 3,
-                "processing_time": 1.0
-            }
-            ranking_results.append(result)
-            await asyncio.sleep(0.5)
+        steps["ranking_check"] = "running"
+        if not await save_job(job_id, {"steps": steps, "progress": 75.0}):
+            logger.info(f"작업이 삭제되어 순위 확인을 중단: {job_id}")
+            return
         
-        active_jobs[job_id]["steps"]["ranking_check"] = "completed"
-        active_jobs[job_id]["results"]["ranking_results"] = ranking_results
-        active_jobs[job_id]["progress"] = 100.0
-        active_jobs[job_id]["status"] = "completed"
-        active_jobs[job_id]["completed_at"] = datetime.now()
+        ranking_results = await run_ranking_checks(
+            request.keywords,
+            request.target_business,
+            max_concurrent=DEFAULT_MAX_CONCURRENT,
+            delay=0.5
+        )
+        
+        steps["ranking_check"] = "completed"
+        results["ranking_results"] = ranking_results
+        await save_job(job_id, {
+            "steps": steps,
+            "results": results,
+            "progress": 100.0,
+            "status": "completed",
+            "completed_at": now_iso()
+        })
         
         logger.info(f"통합 분석 완료: {job_id}")
         
     except Exception as e:
-        active_jobs[job_id]["status"] = "failed"
-        active_jobs[job_id]["error"] = str(e)
+        await save_job(job_id, {"status": "failed", "error": str(e)})
         logger.error(f"통합 분석 실패: {job_id} - {str(e)}")
 
+# ============ Task Queue ============
+# CELERY_BROKER_URL이 설정되면 백그라운드 작업을 Celery 워커에서 실행해 API 프로세스의
+# 이벤트 루프를 비워 둔다. 워커와 API는 Redis 작업 저장소로 상태를 공유하므로 REDIS_URL도
+# 필요하다. 작업 ID는 Celery task id로 그대로 사용한다.
+#   워커 실행: celery -A main.worker_app worker --loglevel=info
+celery_app = None
+if CELERY_BROKER_URL:
+    if not CELERY_AVAILABLE:
+        logger.warning("celery 라이브러리를 찾을 수 없습니다. 백그라운드 작업을 API 프로세스에서 실행합니다.")
+    elif not REDIS_URL:
+        logger.warning("REDIS_URL이 설정되지 않아 Celery 워커를 사용할 수 없습니다. 백그라운드 작업을 API 프로세스에서 실행합니다.")
+    else:
+        celery_app = Celery("rank", broker=CELERY_BROKER_URL, backend=CELERY_RESULT_BACKEND)
+        celery_app.conf.update(
+            task_serializer="json",
+            result_serializer="json",
+            accept_content=["json"],
+            task_track_started=True,
+            task_acks_late=True,
+            worker_prefetch_multiplier=1
+        )
+
+def __getattr__(name: str):
+    # Celery 워커 진입점. celery_app이 None이면 Celery가 기본 앱(amqp://localhost)으로
+    # 작업 없이 조용히 뜨므로, 설정이 빠진 경우 워커 시작 자체를 실패시킨다.
+    if name == "worker_app":
+        if celery_app is None:
+            raise RuntimeError(
+                "Celery 워커를 실행하려면 celery 라이브러리와 CELERY_BROKER_URL, REDIS_URL 설정이 필요합니다"
+            )
+        return celery_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# 워커 프로세스마다 하나의 이벤트 루프를 유지해 Redis 연결과 공유 브라우저를 작업 간에 재사용
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _run_in_worker_loop(coro):
+    """워커 프로세스의 이벤트 루프에서 코루틴 실행"""
+    global _worker_loop
+    
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+        _worker_loop.run_until_complete(init_job_store())
+    
+    return _worker_loop.run_until_complete(coro)
+
+if celery_app is not None:
+    @celery_app.task(name="rank.parallel_ranking")
+    def parallel_ranking_task(job_id: str, payload: Dict[str, Any]):
+        """병렬 순위 확인 작업 (Celery)"""
+        _run_in_worker_loop(execute_parallel_ranking(job_id, RankingRequest(**payload)))
+    
+    @celery_app.task(name="rank.integrated_analysis")
+    def integrated_analysis_task(job_id: str, payload: Dict[str, Any]):
+        """통합 분석 작업 (Celery)"""
+        _run_in_worker_loop(execute_integrated_analysis(job_id, IntegratedAnalysisRequest(**payload)))
+    
+    @worker_process_shutdown.connect
+    def _close_worker_loop(**kwargs):
+        if _worker_loop is not None:
+            _worker_loop.run_until_complete(stop_browser())
+            _worker_loop.run_until_complete(close_http_client())
+            _worker_loop.run_until_complete(close_job_store())
+            _worker_loop.close()
+
+async def enqueue_job(background_tasks: BackgroundTasks, job_id: str, request: BaseModel, job_func, task_name: str):
+    """백그라운드 작업 등록 (Celery 워커 또는 API 프로세스, 등록 실패 시 작업을 failed로 기록)"""
+    if celery_app is None:
+        background_tasks.add_task(job_func, job_id, request)
+        return
+    
+    try:
+        # 브로커 호출은 블로킹이므로 이벤트 루프 밖에서 실행
+        await asyncio.to_thread(
+            celery_app.send_task, task_name,
+            args=(job_id, request.model_dump(mode="json")), task_id=job_id
+        )
+    except Exception as e:
+        await save_job(job_id, {"status": "failed", "error": f"작업 등록 실패: {e}"})
+        raise
+
+async def get_task_state(job_id: str) -> str:
+    """Celery 작업 상태 조회 (PENDING/STARTED/SUCCESS/FAILURE 등)"""
+    return await asyncio.to_thread(lambda: AsyncResult(job_id, app=celery_app).state)
+
 # ============ Helper Functions ============
+# URL 업체명 패턴 (search/ 패턴이 place/ 패턴보다 우선)
+_SEARCH_PATH_RE = re.compile(r'search/([^/]+)')
+_PLACE_PATH_RE = re.compile(r'place/([^/]+)')
+
 def extract_business_name_from_url(url: str) -> Optional[str]:
     """URL에서 업체명 추출"""
     try:
-        # search/ 패턴에서 추출
-        match = re.search(r'search/([^/]+)', url)
-        if match:
-            return urllib.parse.unquote(match.group(1))
-        
-        # place/ 패턴에서 추출
-        match = re.search(r'place/([^/]+)', url)
+        match = _SEARCH_PATH_RE.search(url) or _PLACE_PATH_RE.search(url)
         if match:
             return urllib.parse.unquote(match.group(1))
             
@@ -459,13 +1243,39 @@ def extract_business_name_from_url(url: str) -> Optional[str]:
     
     return None
 
-def generate_mock_rank(keyword: str, target_business: str) -> Optional[int]:
-    """모의 순위 생성"""
+def build_business_matcher(target_business: str) -> Callable[[str], bool]:
+    """
+    업체명 단어 중 하나라도 (소문자) 키워드에 포함되는지 확인하는 함수 생성
+    요청마다 한 번 만들어 모든 키워드에 재사용하며, pyahocorasick이 있으면 모든 단어를
+    키워드 한 번 순회로 찾는 Aho-Corasick 오토마톤을 사용
+    """
+    words = tuple(target_business.lower().split())
+    
+    if not AHOCORASICK_AVAILABLE or not words:
+        return lambda keyword_lower: any(word in keyword_lower for word in words)
+    
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return lambda keyword_lower: any(automaton.iter(keyword_lower))
+
+def generate_mock_rank(
+    keyword: str,
+    target_business: str,
+    business_matcher: Optional[Callable[[str], bool]] = None
+) -> Optional[int]:
+    """모의 순위 생성 (business_matcher는 build_business_matcher로 미리 만든 매칭 함수)"""
     keyword_lower = keyword.lower()
     business_lower = target_business.lower()
     
+    if business_matcher is not None:
+        matches_business = business_matcher(keyword_lower)
+    else:
+        matches_business = any(word in keyword_lower for word in business_lower.split())
+    
     # 키워드와 업체명의 연관성에 따라 순위 결정
-    if any(word in keyword_lower for word in business_lower.split()):
+    if matches_business:
         # 연관성이 높으면 상위 순위
         return random.randint(1, 5)
     elif any(word in business_lower for word in keyword_lower.split()):
@@ -475,93 +1285,176 @@ def generate_mock_rank(keyword: str, target_business: str) -> Optional[int]:
         # 낮은 연관성
         return random.randint(10, 50) if random.random() > 0.3 else None
 
-def generate_sample_place_analysis(business_name: str) -> PlaceAnalysisResult:
-    """샘플 플레이스 분석 데이터 생성"""
+async def simulate_latency(seconds: float):
+    """모의 지연 (SIMULATE_LATENCY가 켜진 경우에만)"""
+    if SIMULATE_LATENCY:
+        await asyncio.sleep(seconds)
+
+def build_mock_ranking_result(
+    keyword: str,
+    target_business: str,
+    processing_time: float,
+    business_matcher: Optional[Callable[[str], bool]] = None
+) -> Dict[str, Any]:
+    """모의 순위 결과 생성"""
+    rank = generate_mock_rank(keyword, target_business, business_matcher)
+    return {
+        "keyword": keyword,
+        "target_business": target_business,
+        "found": rank is not None,
+        "rank": rank,
+        "total_results": rank * 10 if rank else 0,
+        "pages_checked": min(3, (rank // 10) + 1) if rank else 3,
+        "processing_time": processing_time
+    }
+
+async def run_ranking_checks(
+    keywords: List[str],
+    target_business: str,
+    max_concurrent: int,
+    delay: float,
+    on_result=None
+) -> List[Dict[str, Any]]:
+    """
+    키워드별 순위 확인을 최대 max_concurrent개씩 동시에 실행
+    결과는 입력 키워드 순서를 유지하며, on_result는 키워드가 끝날 때마다 호출됨
+    delay는 SIMULATE_LATENCY가 켜진 경우 키워드마다 두는 모의 지연(초)
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    business_matcher = build_business_matcher(target_business)
     
-    # 업체명에 따른 동적 데이터 생성
-    is_academy = any(word in business_name for word in ['학원', '아카데미', '스쿨'])
-    is_english = any(word in business_name for word in ['영어', 'English', '미래엔'])
-    
-    if is_academy and is_english:
-        category = "영어학원"
-        programs = ["초등영어", "중등영어", "파닉스", "회화"]
-        keywords = ["영어학원", "초등영어", "중등영어"]
-        pricing = "월 12만원~18만원 (과정별 상이)"
-        coupons = ["무료 체험 수업", "형제 할인 10%"]
-        facilities = ["주차장", "상담실", "독서실", "대기실"]
-        description = f"{business_name}는 미래엔 교재를 사용하는 체계적인 영어교육 전문학원입니다."
-    else:
-        category = "교육업"
-        programs = ["기본과정", "심화과정", "특별과정"]
-        keywords = ["학원", "교육", "수업"]
-        pricing = "월 10만원~15만원"
-        coupons = ["체험 수업", "신규 할인"]
-        facilities = ["주차장", "상담실", "대기실"]
-        description = f"{business_name}는 전문적인 교육 서비스를 제공합니다."
+    async def check_one(keyword: str) -> Dict[str, Any]:
+        async with semaphore:
+            started = time.perf_counter()
+            await simulate_latency(delay)
+            result = build_mock_ranking_result(
+                keyword, target_business, round(time.perf_counter() - started, 2), business_matcher
+            )
+        
+        if on_result is not None:
+            await on_result(result)
+        return result
     
-    # 점수 계산
+    return list(await asyncio.gather(*(check_one(keyword) for keyword in keywords)))
+
+# 샘플 분석 데이터는 업종 템플릿 두 가지 중 하나에서 만들어지므로, 목록·추천사항 등
+# 변하지 않는 부분은 모듈 로드 시 한 번만 만들어 두고 업체명에 따른 부분만 호출 시 계산한다.
+class _PlaceTemplate(NamedTuple):
+    category: str
+    programs: Tuple[str, ...]
+    keywords: Tuple[str, ...]
+    pricing: str
+    coupons: Tuple[str, ...]
+    facilities: Tuple[str, ...]
+    description: str  # {business_name} 자리 표시자 포함
+    base_score: int  # 업체명과 무관한 완성도 점수 (프로그램/시설 수 반영)
+
+def _make_place_template(**fields: Any) -> _PlaceTemplate:
     base_score = 70
-    if "미래엔" in business_name:
-        base_score += 10
-    if len(programs) > 3:
+    if len(fields["programs"]) > 3:
         base_score += 5
-    if len(facilities) > 3:
+    if len(fields["facilities"]) > 3:
         base_score += 5
+    return _PlaceTemplate(base_score=base_score, **fields)
+
+_ENGLISH_ACADEMY_TEMPLATE = _make_place_template(
+    category="영어학원",
+    programs=("초등영어", "중등영어", "파닉스", "회화"),
+    keywords=("영어학원", "초등영어", "중등영어"),
+    pricing="월 12만원~18만원 (과정별 상이)",
+    coupons=("무료 체험 수업", "형제 할인 10%"),
+    facilities=("주차장", "상담실", "독서실", "대기실"),
+    description="{business_name}는 미래엔 교재를 사용하는 체계적인 영어교육 전문학원입니다."
+)
+
+_GENERIC_TEMPLATE = _make_place_template(
+    category="교육업",
+    programs=("기본과정", "심화과정", "특별과정"),
+    keywords=("학원", "교육", "수업"),
+    pricing="월 10만원~15만원",
+    coupons=("체험 수업", "신규 할인"),
+    facilities=("주차장", "상담실", "대기실"),
+    description="{business_name}는 전문적인 교육 서비스를 제공합니다."
+)
+
+_ACADEMY_WORDS = ("학원", "아카데미", "스쿨")
+_ENGLISH_WORDS = ("영어", "English", "미래엔")
+_BRAND_KEYWORD = "미래엔"
+
+_SAMPLE_BASIC_INFO = {
+    "address": "광주광역시 서구 벌원동 123-45",
+    "phone": "062-123-4567",
+    "hours": "월~금 14:00-22:00, 토 09:00-18:00",
+    "rating": 4.2,
+    "review_count": 28
+}
+_SAMPLE_IMAGES = ("외관", "교실", "상담실", "교재", "수업모습")
+_SAMPLE_STRENGTHS = ("기본 정보 완성", "프로그램 다양성", "할인 혜택")
+_BASIC_MISSING_ELEMENTS = ("상세 프로그램 설명", "교사 소개")
+
+_BRAND_KEYWORD_RECOMMENDATION = {
+    "priority": "high",
+    "title": "브랜드 키워드 추가",
+    "description": "'미래엔영어', '미래엔 교재' 등 브랜드 연관 키워드를 추가하세요."
+}
+_PROGRAM_DETAIL_RECOMMENDATION = {
+    "priority": "medium",
+    "title": "프로그램 상세 설명",
+    "description": "각 과정별 특징과 교육 방식을 구체적으로 설명하세요."
+}
+_IMAGE_CONTENT_RECOMMENDATION = {
+    "priority": "medium",
+    "title": "이미지 콘텐츠 보강",
+    "description": "학원 시설, 수업 모습, 교재 등의 사진을 추가하세요."
+}
+
+def generate_sample_place_analysis(business_name: str) -> PlaceAnalysisResult:
+    """샘플 플레이스 분석 데이터 생성"""
+    
+    # 업체명에 따른 템플릿 선택
+    is_academy = any(word in business_name for word in _ACADEMY_WORDS)
+    is_english = any(word in business_name for word in _ENGLISH_WORDS)
+    template = _ENGLISH_ACADEMY_TEMPLATE if is_academy and is_english else _GENERIC_TEMPLATE
     
-    completeness_score = min(base_score, 100)
+    # 점수 계산
+    has_brand = _BRAND_KEYWORD in business_name
+    completeness_score = min(template.base_score + (10 if has_brand else 0), 100)
+    missing_brand_keyword = has_brand and _BRAND_KEYWORD not in template.keywords
     
     # 누락 요소 계산
     missing_elements = []
     if completeness_score < 80:
-        missing_elements.extend(["상세 프로그램 설명", "교사 소개"])
-    if "미래엔" not in keywords and "미래엔" in business_name:
+        missing_elements.extend(_BASIC_MISSING_ELEMENTS)
+    if missing_brand_keyword:
         missing_elements.append("브랜드 키워드")
     
     # 추천사항 생성
     recommendations = []
-    if "미래엔" not in keywords and "미래엔" in business_name:
-        recommendations.append({
-            "priority": "high",
-            "title": "브랜드 키워드 추가",
-            "description": "'미래엔영어', '미래엔 교재' 등 브랜드 연관 키워드를 추가하세요."
-        })
-    
+    if missing_brand_keyword:
+        recommendations.append(_BRAND_KEYWORD_RECOMMENDATION)
     if completeness_score < 75:
-        recommendations.append({
-            "priority": "medium",
-            "title": "프로그램 상세 설명",
-            "description": "각 과정별 특징과 교육 방식을 구체적으로 설명하세요."
-        })
-    
-    recommendations.append({
-        "priority": "medium",
-        "title": "이미지 콘텐츠 보강",
-        "description": "학원 시설, 수업 모습, 교재 등의 사진을 추가하세요."
-    })
+        recommendations.append(_PROGRAM_DETAIL_RECOMMENDATION)
+    recommendations.append(_IMAGE_CONTENT_RECOMMENDATION)
     
     return PlaceAnalysisResult(
         basic_info=BasicInfo(
             name=business_name,
-            category=category,
-            address="광주광역시 서구 벌원동 123-45",
-            phone="062-123-4567",
-            hours="월~금 14:00-22:00, 토 09:00-18:00",
-            rating=4.2,
-            review_count=28
+            category=template.category,
+            **_SAMPLE_BASIC_INFO
         ),
         details=PlaceDetails(
-            description=description,
-            facilities=facilities,
-            programs=programs,
-            pricing=pricing,
-            images=["외관", "교실", "상담실", "교재", "수업모습"],
-            coupons=coupons,
-            keywords=keywords
+            description=template.description.format(business_name=business_name),
+            facilities=template.facilities,
+            programs=template.programs,
+            pricing=template.pricing,
+            images=_SAMPLE_IMAGES,
+            coupons=template.coupons,
+            keywords=template.keywords
         ),
         analysis=PlaceAnalysis(
             completeness_score=completeness_score,
             missing_elements=missing_elements,
-            strengths=["기본 정보 완성", "프로그램 다양성", "할인 혜택"],
+            strengths=_SAMPLE_STRENGTHS,
             recommendations=recommendations
         )
     )
@@ -585,9 +1478,21 @@ def generate_integrated_summary(results: Dict[str, Any]) -> Dict[str, Any]:
     # 순위 확인 요약
     if results.get("ranking_results"):
         ranking_data = results["ranking_results"]
-        first_place_count = sum(1 for r in ranking_data if r.get("rank") == 1)
-        top_ten_count = sum(1 for r in ranking_data if r.get("rank") and r["rank"] <= 10)
-        found_count = sum(1 for r in ranking_data if r.get("found"))
+        
+        # 한 번의 순회로 모든 집계 계산
+        first_place_count = top_ten_count = found_count = 0
+        top_keywords = []
+        for r in ranking_data:
+            if r.get("found"):
+                found_count += 1
+            rank = r.get("rank")
+            if rank:
+                if rank == 1:
+                    first_place_count += 1
+                if rank <= 10:
+                    top_ten_count += 1
+                if rank <= 3 and len(top_keywords) < 3:
+                    top_keywords.append(r["keyword"])
         
         summary["ranking_summary"] = {
             "total_keywords": len(ranking_data),
@@ -595,14 +1500,156 @@ def generate_integrated_summary(results: Dict[str, Any]) -> Dict[str, Any]:
             "top_ten_count": top_ten_count,
             "found_count": found_count,
             "success_rate": round((found_count / len(ranking_data)) * 100, 1),
-            "top_performing_keywords": [
-                r["keyword"] for r in ranking_data 
-                if r.get("rank") and r["rank"] <= 3
-            ][:3]
+            "top_performing_keywords": top_keywords
         }
     
     return summary
 
+# ============ Browser Pool ============
+# 브라우저는 프로세스당 하나만 띄워 두고 요청마다 격리된 BrowserContext를 대여한다.
+# MAX_USES_PER_BROWSER번 대여되면 새 브라우저로 교체하고, 이전 브라우저는 사용 중인
+# 컨텍스트가 모두 반납된 뒤 종료한다. BROWSER_CDP_URL이 설정되면 직접 띄우지 않고
+# 해당 CDP 엔드포인트의 브라우저에 연결하며, BROWSER_CDP_PORT를 설정하면 직접 띄운
+# 브라우저를 그 포트로 노출해 다른 워커가 연결할 수 있다.
+playwright_instance = None
+browser = None
+browser_pool = asyncio.Semaphore(BROWSER_POOL_SIZE)
+_browser_lock = asyncio.Lock()
+_browser_uses = 0
+_browser_leases: Dict[Any, int] = {}
+
+async def _launch_browser():
+    """브라우저 실행 또는 CDP 연결 (_browser_lock 보유 상태에서 호출)"""
+    global playwright_instance, browser, _browser_uses
+    
+    if playwright_instance is None:
+        from playwright.async_api import async_playwright
+        playwright_instance = await async_playwright().start()
+    
+    if BROWSER_CDP_URL:
+        browser = await playwright_instance.chromium.connect_over_cdp(BROWSER_CDP_URL)
+        logger.info(f"공유 브라우저 연결: {BROWSER_CDP_URL}")
+    else:
+        args = [f"--remote-debugging-port={BROWSER_CDP_PORT}"] if BROWSER_CDP_PORT else []
+        browser = await playwright_instance.chromium.launch(headless=True, args=args)
+        logger.info("공유 브라우저 실행")
+    
+    _browser_uses = 0
+    _browser_leases[browser] = 0
+
+async def _close_browser(target):
+    """브라우저 종료 (CDP 연결인 경우 연결만 해제)"""
+    _browser_leases.pop(target, None)
+    try:
+        await target.close()
+    except Exception as e:
+        logger.warning(f"브라우저 종료 오류: {e}")
+
+async def _acquire_browser():
+    """컨텍스트를 만들 브라우저 대여 (필요 시 실행/교체)"""
+    global _browser_uses
+    
+    async with _browser_lock:
+        if browser is None or not browser.is_connected():
+            if browser is not None:
+                await _close_browser(browser)
+            await _launch_browser()
+        elif _browser_uses >= MAX_USES_PER_BROWSER:
+            retired = browser
+            await _launch_browser()
+            if _browser_leases.get(retired) == 0:
+                await _close_browser(retired)
+        
+        _browser_uses += 1
+        _browser_leases[browser] += 1
+        return browser
+
+async def _release_browser(used):
+    """대여한 브라우저 반납 (교체된 브라우저는 마지막 반납 시 종료)"""
+    async with _browser_lock:
+        if used not in _browser_leases:
+            return
+        _browser_leases[used] -= 1
+        if used is not browser and _browser_leases[used] == 0:
+            await _close_browser(used)
+
+@asynccontextmanager
+async def browser_context():
+    """브라우저 풀에서 격리된 BrowserContext 대여"""
+    async with browser_pool:
+        used = await _acquire_browser()
+        try:
+            context = await used.new_context()
+            try:
+                yield context
+            finally:
+                await context.close()
+        finally:
+            await _release_browser(used)
+
+async def start_browser():
+    """서버 시작 시 공유 브라우저 준비 (BROWSER_PRELAUNCH가 꺼져 있거나 실패하면 첫 스크래핑 때 실행)"""
+    if not PLAYWRIGHT_AVAILABLE or not BROWSER_PRELAUNCH:
+        return
+    
+    try:
+        async with _browser_lock:
+            await _launch_browser()
+    except Exception as e:
+        logger.error(f"공유 브라우저 시작 실패: {e}")
+
+async def stop_browser():
+    """서버 종료 시 공유 브라우저 및 Playwright 정리"""
+    global playwright_instance, browser
+    
+    async with _browser_lock:
+        for target in list(_browser_leases):
+            await _close_browser(target)
+        browser = None
+        
+        if playwright_instance is not None:
+            await playwright_instance.stop()
+            playwright_instance = None
+
+# ============ HTTP Client ============
+# JS 렌더링이 필요 없는 검색 결과는 브라우저 대신 프로세스 공용 httpx 클라이언트로 받는다.
+# 호스트당 연결을 재사용하고(HTTP/2면 하나의 연결로 다중화) TLS 핸드셰이크를 한 번만 한다.
+http_client = None
+
+NAVER_REQUEST_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) "
+        "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1"
+    ),
+    "Accept-Language": "ko-KR,ko;q=0.9",
+    "Referer": "https://m.place.naver.com/"
+}
+
+def get_http_client():
+    """공용 HTTP 클라이언트 (최초 호출 시 생성, httpx가 없으면 None)"""
+    global http_client
+    
+    if http_client is None and HTTP_SCRAPING_AVAILABLE:
+        http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            timeout=HTTP_TIMEOUT_SECONDS,
+            headers=NAVER_REQUEST_HEADERS,
+            follow_redirects=True
+        )
+    return http_client
+
+async def close_http_client():
+    """공용 HTTP 클라이언트 종료"""
+    global http_client
+    
+    if http_client is not None:
+        await http_client.aclose()
+        http_client = None
+
 # ============ 실제 스크래핑 함수들 (향후 구현용) ============
 async def scrape_naver_place_info(url: str) -> Dict[str, Any]:
     """
@@ -612,11 +1659,13 @@ async def scrape_naver_place_info(url: str) -> Dict[str, Any]:
     if not PLAYWRIGHT_AVAILABLE:
         logger.warning("Playwright가 설치되지 않아 샘플 데이터를 반환합니다")
         business_name = extract_business_name_from_url(url) or "스크래핑 대상 업체"
-        return generate_sample_place_analysis(business_name).dict()
+        return generate_sample_place_analysis(business_name).model_dump(mode="json")
+    
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+    # 공유 브라우저의 컨텍스트를 대여하고, 반납 시 컨텍스트와 페이지가 함께 정리됨
+    async with browser_context() as context:
+        page = await context.new_page()
         
         try:
             await page.goto(url, wait_until="load", timeout=90000)
@@ -629,26 +1678,28 @@ async def scrape_naver_place_info(url: str) -> Dict[str, Any]:
                 await frame.wait_for_selector("#_title", timeout=20000)
                 
                 # 기본 정보 추출
-                place_name = await get_text_or_default(frame, "#_title > div > span.GHAhO")
-                category = await get_text_or_default(frame, "#_title > div > span.lnJFt")
+                place_name, category = await asyncio.gather(
+                    get_text_or_default(frame, "#_title > div > span.GHAhO"),
+                    get_text_or_default(frame, "#_title > div > span.lnJFt")
+                )
                 
-            except TimeoutError:
+            except PlaywrightTimeoutError:
                 # 직접 접근 방식 시도
                 frame = page
-                place_name = await get_text_or_default(frame, "h1", "업체명 정보 없음")
-                category = await get_text_or_default(frame, ".category", "업종 정보 없음")
+                place_name, category = await asyncio.gather(
+                    get_text_or_default(frame, "h1", "업체명 정보 없음"),
+                    get_text_or_default(frame, ".category", "업종 정보 없음")
+                )
             
-            # 기본 정보 수집
+            # 기본 정보, 편의시설, 가격 정보는 서로 독립적인 셀렉터이므로 동시에 수집
             main_content_selector = "#app-root > div > div > div:nth-child(6)"
             
-            address = await get_text_or_default(frame, f"{main_content_selector} .LDgIH")
-            phone = await get_text_or_default(frame, f"{main_content_selector} .xlx7Q")
-            
-            # 편의시설 정보
-            facilities = await get_facilities(frame, f"{main_content_selector} .Uv6Eo")
-            
-            # 가격 정보
-            pricing = await get_list_items_as_text(frame, f"{main_content_selector} .tXI2c li")
+            address, phone, facilities, pricing = await asyncio.gather(
+                get_text_or_default(frame, f"{main_content_selector} .LDgIH"),
+                get_text_or_default(frame, f"{main_content_selector} .xlx7Q"),
+                get_facilities(frame, f"{main_content_selector} .Uv6Eo"),
+                get_list_items_as_text(frame, f"{main_content_selector} .tXI2c li")
+            )
             
             return {
                 "basic_info": {
@@ -669,19 +1720,242 @@ async def scrape_naver_place_info(url: str) -> Dict[str, Any]:
         except Exception as e:
             logger.error(f"플레이스 스크래핑 오류: {e}")
             raise
-        finally:
-            await browser.close()
+
+# 네이버 지도 검색 결과 셀렉터
+NAVER_MAP_SEARCH_URL = "https://map.naver.com/p/search/{query}"
+SEARCH_IFRAME_SELECTOR = "#searchIframe"
+SEARCH_SCROLL_CONTAINER_SELECTOR = "#_pcmap_list_scroll_container"
+SEARCH_LIST_ITEM_SELECTOR = f"{SEARCH_SCROLL_CONTAINER_SELECTOR} > ul > li"
+SEARCH_ITEM_NAME_SELECTOR = "span.TYaxT"
+SEARCH_NEXT_PAGE_SELECTOR = "a.eUTV2[aria-disabled='false']:last-child"
+
+# 모바일 플레이스 검색 결과 (서버 렌더링 HTML)
+NAVER_PLACE_LIST_URL = "https://m.place.naver.com/place/list"
+PLACE_LIST_PAGE_SIZE = 50
+PLACE_LIST_NAME_SELECTOR = "li span.YwYLL, li span.TYaxT"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+def _normalize_business_name(name: str) -> str:
+    """업체명 비교용 정규화 (공백 제거, 소문자)"""
+    return _WHITESPACE_RE.sub("", name).lower()
+
+def build_search_url(keyword: str, location: LocationSettings) -> str:
+    """키워드 검색 URL 생성 (좌표가 있으면 지도 중심으로 지정)"""
+    url = NAVER_MAP_SEARCH_URL.format(query=urllib.parse.quote(keyword))
+    if location.lat is not None and location.lng is not None:
+        url += f"?c={location.lng},{location.lat},15,0,0,0,dh"
+    return url
+
+async def _scroll_result_list(frame, max_rounds: int = 10):
+    """검색 결과 목록을 끝까지 스크롤해 지연 로딩된 항목까지 불러오기"""
+    previous = -1
+    for _ in range(max_rounds):
+        count = await frame.locator(SEARCH_LIST_ITEM_SELECTOR).count()
+        if count == previous:
+            break
+        previous = count
+        await frame.evaluate(
+            "sel => { const el = document.querySelector(sel); if (el) el.scrollTop = el.scrollHeight; }",
+            SEARCH_SCROLL_CONTAINER_SELECTOR
+        )
+        await frame.wait_for_timeout(500)
+
+def _scraped_ranking_result(
+    keyword: str,
+    target_business: str,
+    started: float,
+    rank: Optional[int],
+    total_results: int,
+    pages_checked: int,
+    error: Optional[str] = None
+) -> Dict[str, Any]:
+    """실제 검색 순위 결과 생성 (started는 time.perf_counter() 기준 시작 시각)"""
+    return {
+        "keyword": keyword,
+        "target_business": target_business,
+        "found": rank is not None,
+        "rank": rank,
+        "total_results": total_results,
+        "pages_checked": pages_checked,
+        "processing_time": round(time.perf_counter() - started, 2),
+        "error": error
+    }
+
+async def fetch_serp(keyword: str, location: LocationSettings, page: int = 1) -> str:
+    """모바일 플레이스 검색 결과 HTML 요청 (공용 HTTP 클라이언트 사용)"""
+    params = {
+        "query": keyword,
+        "start": (page - 1) * PLACE_LIST_PAGE_SIZE + 1,
+        "display": PLACE_LIST_PAGE_SIZE
+    }
+    if location.lat is not None and location.lng is not None:
+        params["x"] = location.lng
+        params["y"] = location.lat
+    
+    response = await get_http_client().get(NAVER_PLACE_LIST_URL, params=params)
+    response.raise_for_status()
+    return response.text
+
+def parse_serp_names(html: str) -> List[str]:
+    """검색 결과 HTML에서 업체명 목록 추출"""
+    tree = HTMLParser(html)
+    return [node.text(strip=True) for node in tree.css(PLACE_LIST_NAME_SELECTOR)]
+
+async def search_keyword_rank_http(
+    keyword: str,
+    target_business: str,
+    location: LocationSettings,
+    max_pages: int
+) -> Optional[Dict[str, Any]]:
+    """
+    브라우저 없이 HTTP로 순위 확인
+    결과 목록이 JS로만 렌더링되어 비어 있거나 요청이 실패하면 None (Playwright로 재시도)
+    """
+    if not HTTP_SCRAPING_AVAILABLE:
+        return None
+    
+    started = time.perf_counter()
+    target = _normalize_business_name(target_business)
+    total_results = 0
+    
+    try:
+        for page_no in range(1, max_pages + 1):
+            names = parse_serp_names(await fetch_serp(keyword, location, page_no))
+            if not names:
+                if page_no == 1:
+                    return None
+                break
+            
+            for index, name in enumerate(names, start=1):
+                if target in _normalize_business_name(name):
+                    return _scraped_ranking_result(
+                        keyword, target_business, started,
+                        rank=total_results + index,
+                        total_results=total_results + len(names),
+                        pages_checked=page_no
+                    )
+            total_results += len(names)
+            
+            if len(names) < PLACE_LIST_PAGE_SIZE:
+                break
+        
+        return _scraped_ranking_result(
+            keyword, target_business, started,
+            rank=None, total_results=total_results, pages_checked=page_no
+        )
+        
+    except httpx.HTTPError as e:
+        logger.warning(f"HTTP 순위 검색 실패, 브라우저로 재시도 ({keyword}): {e}")
+        return None
+
+async def find_rank_on_page(page, keyword: str, target_business: str, location: LocationSettings, max_pages: int) -> Dict[str, Any]:
+    """이미 열린 페이지에서 키워드를 검색해 대상 업체 순위 확인"""
+    started = time.perf_counter()
+    target = _normalize_business_name(target_business)
+    checked_pages = 0
+    total_results = 0
+    
+    def result(rank: Optional[int] = None, error: Optional[str] = None) -> Dict[str, Any]:
+        return _scraped_ranking_result(
+            keyword, target_business, started, rank, total_results, checked_pages, error
+        )
+    
+    try:
+        await page.goto(build_search_url(keyword, location), wait_until="domcontentloaded", timeout=30000)
+        search_iframe = await page.wait_for_selector(SEARCH_IFRAME_SELECTOR, timeout=10000)
+        frame = await search_iframe.content_frame()
+        
+        for page_no in range(1, max_pages + 1):
+            await frame.wait_for_selector(SEARCH_LIST_ITEM_SELECTOR, timeout=10000)
+            await _scroll_result_list(frame)
+            checked_pages = page_no
+            
+            names = await frame.locator(f"{SEARCH_LIST_ITEM_SELECTOR} {SEARCH_ITEM_NAME_SELECTOR}").all_inner_texts()
+            for index, name in enumerate(names, start=1):
+                if target in _normalize_business_name(name):
+                    total_results += len(names)
+                    return result(rank=total_results - len(names) + index)
+            total_results += len(names)
+            
+            next_button = frame.locator(SEARCH_NEXT_PAGE_SELECTOR)
+            if page_no == max_pages or await next_button.count() == 0:
+                break
+            await next_button.click()
+            await frame.wait_for_timeout(1000)
+        
+        return result()
+        
+    except Exception as e:
+        logger.error(f"순위 검색 오류 ({keyword}): {e}")
+        return result(error=str(e))
+
+async def _search_keyword_batch(keywords: List[str], target_business: str, location: LocationSettings, max_pages: int) -> List[Dict[str, Any]]:
+    """하나의 컨텍스트·페이지에서 키워드 묶음을 차례로 검색 (쿠키, 연결, JS 캐시 재사용)"""
+    async with browser_context() as context:
+        page = await context.new_page()
+        results = []
+        for keyword in keywords:
+            if page.is_closed():
+                page = await context.new_page()
+            results.append(await find_rank_on_page(page, keyword, target_business, location, max_pages))
+        return results
+
+async def search_multiple_keywords_parallel(
+    keywords: List[str],
+    target_business: str,
+    location: LocationSettings,
+    max_pages: int,
+    max_concurrent: int
+) -> List[Dict[str, Any]]:
+    """
+    실제 네이버 지도 순위 확인
+    먼저 모든 키워드를 HTTP로 확인하고, JS 렌더링이 필요한 키워드만 브라우저로 확인한다.
+    브라우저 확인은 키워드를 max_concurrent개 묶음으로 나누고, 묶음마다 하나의 페이지를
+    유지하며 순차 검색(페이지 생성·초기 로딩 비용을 묶음 단위로 분산). 결과는 입력 키워드 순서를 유지함
+    """
+    # HTTP 확인도 브라우저 확인과 같이 max_concurrent개까지만 동시에 요청
+    semaphore = asyncio.Semaphore(max_concurrent)
+    
+    async def check_http(keyword: str) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            return await search_keyword_rank_http(keyword, target_business, location, max_pages)
+    
+    results: List[Optional[Dict[str, Any]]] = list(await asyncio.gather(*(
+        check_http(keyword) for keyword in keywords
+    )))
+    
+    pending = [i for i, result in enumerate(results) if result is None]
+    batch_count = min(max_concurrent, len(pending))
+    if batch_count == 0:
+        return results
+    
+    # 키워드를 번갈아 배분해 묶음 크기를 고르게 유지
+    batches = [pending[i::batch_count] for i in range(batch_count)]
+    batch_results = await asyncio.gather(*(
+        _search_keyword_batch([keywords[i] for i in batch], target_business, location, max_pages)
+        for batch in batches
+    ))
+    
+    for batch, batch_result in zip(batches, batch_results):
+        for i, result in zip(batch, batch_result):
+            results[i] = result
+    return results
 
 async def get_text_or_default(frame, selector, default="정보 없음"):
     """텍스트 안전 추출"""
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    
     try:
         await frame.wait_for_selector(selector, state='attached', timeout=2000)
         return await frame.locator(selector).first.inner_text(timeout=1000)
-    except TimeoutError:
+    except PlaywrightTimeoutError:
         return default
 
 async def get_facilities(frame, container_selector, default="정보 없음"):
     """편의시설 정보 추출"""
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    
     try:
         await frame.wait_for_selector(container_selector, state='visible', timeout=3000)
         items = await frame.locator(f"{container_selector} span").all()
@@ -689,11 +1963,13 @@ async def get_facilities(frame, container_selector, default="정보 없음"):
             return default
         texts = await asyncio.gather(*(item.inner_text() for item in items))
         return ", ".join(filter(None, texts))
-    except TimeoutError:
+    except PlaywrightTimeoutError:
         return default
 
 async def get_list_items_as_text(frame, list_selector, default="정보 없음"):
     """리스트 아이템들을 텍스트로 변환"""
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    
     try:
         await frame.wait_for_selector(list_selector, state='attached', timeout=3000)
         items = await frame.locator(list_selector).all()
@@ -701,7 +1977,7 @@ async def get_list_items_as_text(frame, list_selector, default="정보 없음"):
             return default
         texts = await asyncio.gather(*(item.inner_text() for item in items))
         return "\n".join(texts)
-    except TimeoutError:
+    except PlaywrightTimeoutError:
         return default
 
 # ============ 서버 실행 ============
@@ -710,7 +1986,16 @@ if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
     host = os.environ.get("HOST", "0.0.0.0")
     
-    logger.info(f"서버 시작: {host}:{port}")
+    # 작업 상태를 Redis에 저장할 때만 여러 워커가 같은 작업을 볼 수 있으므로 기본값을 나눠 둔다
+    default_workers = (os.cpu_count() or 2) if REDIS_URL else 1
+    workers = int(os.environ.get("WORKERS", default_workers))
+    loop = os.environ.get("UVICORN_LOOP", "asyncio" if os.name == "nt" else "uvloop")
+    http = os.environ.get("UVICORN_HTTP", "httptools")
+    
+    if workers > 1 and not REDIS_URL:
+        logger.warning("REDIS_URL 없이 여러 워커를 실행하면 워커마다 작업 상태가 분리됩니다")
+    
+    logger.info(f"서버 시작: {host}:{port} (workers={workers}, loop={loop}, http={http})")
     logger.info("네이버 지도 통합 분석 API v3.0 시작")
     
-    uvicorn.run(app, host=host, port=port, log_level="info")
\ No newline at end of file
+    uvicorn.run("main:app", host=host, port=port, loop=loop, http=http, workers=workers, log_level="info")
\ No newline at end of file